@@ -19,50 +19,78 @@ Run the bot using::
     uv run bot.py
 """
 
+from __future__ import annotations
+
+import functools
 import os
+from typing import TYPE_CHECKING
 
 from dotenv import load_dotenv
 from loguru import logger
 
+if TYPE_CHECKING:
+    from pipecat.runner.types import RunnerArguments
+    from pipecat.transports.base_transport import BaseTransport
+
 print("🚀 Starting Pipecat bot...")
-print("⏳ Loading models and imports (20 seconds, first run only)\n")
 
-logger.info("Loading Local Smart Turn Analyzer V3...")
-from pipecat.audio.turn.smart_turn.local_smart_turn_v3 import LocalSmartTurnAnalyzerV3
+load_dotenv(override=True)
 
-logger.info("✅ Local Smart Turn Analyzer V3 loaded")
-logger.info("Loading Silero VAD model...")
-from pipecat.audio.vad.silero import SileroVADAnalyzer
 
-logger.info("✅ Silero VAD model loaded")
+@functools.lru_cache(maxsize=1)
+def _load_analyzers():
+    """Import the VAD and turn analyzers on first use (~20 seconds, first run only)."""
+    print("⏳ Loading models and imports (20 seconds, first run only)\n")
 
-from pipecat.audio.vad.vad_analyzer import VADParams
-from pipecat.frames.frames import LLMRunFrame
+    logger.info("Loading VAD and turn analyzers...")
+    from shared_analyzers import SharedLocalSmartTurnAnalyzerV3, SharedSileroVADAnalyzer
 
-logger.info("Loading pipeline components...")
-from pipecat.pipeline.pipeline import Pipeline
-from pipecat.pipeline.runner import PipelineRunner
-from pipecat.pipeline.task import PipelineParams, PipelineTask
-from pipecat.processors.aggregators.llm_context import LLMContext
-from pipecat.processors.aggregators.llm_response_universal import LLMContextAggregatorPair
-from pipecat.processors.frameworks.rtvi import RTVIConfig, RTVIObserver, RTVIProcessor
-from pipecat.runner.types import RunnerArguments
-from pipecat.runner.utils import create_transport
-from pipecat.services.openai.llm import OpenAILLMService
-from pipecat.services.openai.stt import OpenAISTTService
+    logger.info("✅ VAD and turn analyzers loaded")
+    return SharedSileroVADAnalyzer, SharedLocalSmartTurnAnalyzerV3
 
-from custom_tts import CustomOpenAITTSService
-from tts_with_timing_processor import TTSWithTimingProcessor
-from pipecat.transports.base_transport import BaseTransport, TransportParams
-from pipecat.transports.daily.transport import DailyParams
-from pipecat.transports.livekit.transport import LiveKitParams
 
-logger.info("✅ All components loaded successfully!")
+def _vad_analyzer():
+    """Create a per-session VAD analyzer backed by the shared Silero model."""
+    from pipecat.audio.vad.vad_analyzer import VADParams
 
-load_dotenv(override=True)
+    SharedSileroVADAnalyzer, _ = _load_analyzers()
+    return SharedSileroVADAnalyzer(params=VADParams(stop_secs=0.2))
+
+
+def _turn_analyzer():
+    """Create a per-session end-of-turn analyzer backed by the shared model."""
+    _, SharedLocalSmartTurnAnalyzerV3 = _load_analyzers()
+    return SharedLocalSmartTurnAnalyzerV3()
+
+
+# AsyncOpenAI clients shared by every session, keyed by service kind and endpoint
+_OPENAI_CLIENTS = {}
+
+
+def _share_openai_client(service, kind: str, api_key: str | None, base_url: str | None):
+    """Point `service` at the process-wide client for its endpoint.
+
+    The first service constructed for an endpoint donates its client (keeping
+    whatever connection limits that service configures); later sessions reuse
+    it, and its pooled connections, instead of opening new ones.
+    """
+    service._client = _OPENAI_CLIENTS.setdefault((kind, api_key, base_url), service._client)
 
 
 async def run_bot(transport: BaseTransport, runner_args: RunnerArguments):
+    from pipecat.frames.frames import LLMRunFrame
+    from pipecat.pipeline.pipeline import Pipeline
+    from pipecat.pipeline.runner import PipelineRunner
+    from pipecat.pipeline.task import PipelineParams, PipelineTask
+    from pipecat.processors.aggregators.llm_context import LLMContext
+    from pipecat.processors.aggregators.llm_response_universal import LLMContextAggregatorPair
+    from pipecat.processors.frameworks.rtvi import RTVIConfig, RTVIObserver, RTVIProcessor
+    from pipecat.services.openai.llm import OpenAILLMService
+    from pipecat.services.openai.stt import OpenAISTTService
+
+    from custom_tts import CustomOpenAITTSService
+    from tts_with_timing_processor import TTSWithTimingProcessor
+
     logger.info(f"Starting bot")
 
     stt = OpenAISTTService(
@@ -89,6 +117,10 @@ async def run_bot(transport: BaseTransport, runner_args: RunnerArguments):
         model=os.getenv("LLM_MODEL") or "gpt-4o-mini",
     )
 
+    _share_openai_client(stt, "stt", os.getenv("STT_API_KEY"), os.getenv("STT_BASE_URL"))
+    _share_openai_client(tts, "tts", os.getenv("TTS_API_KEY"), os.getenv("TTS_BASE_URL"))
+    _share_openai_client(llm, "llm", os.getenv("LLM_API_KEY"), os.getenv("LLM_BASE_URL"))
+
     messages = [
         {
             "role": "system",
@@ -142,7 +174,16 @@ async def run_bot(transport: BaseTransport, runner_args: RunnerArguments):
 
 async def bot(runner_args: RunnerArguments):
     """Main bot entry point for the bot starter."""
+    from pipecat.runner.utils import create_transport
+    from pipecat.transports.base_transport import TransportParams
+    from pipecat.transports.daily.transport import DailyParams
+    from pipecat.transports.livekit.transport import LiveKitParams
+
+    from tts_with_timing_processor import shared_http_client
 
+    # Model inference for both analyzers already runs off the event loop: each
+    # VADAnalyzer / BaseSmartTurn instance owns a single-worker
+    # ThreadPoolExecutor used by analyze_audio() / analyze_end_of_turn().
     transport_params = {
         # ✅ PRIMARY: LiveKit transport
         "livekit": lambda: LiveKitParams(
@@ -150,28 +191,31 @@ async def bot(runner_args: RunnerArguments):
             audio_out_enabled=True,
             camera_in_enabled=False,  # Set to True for multimodal (vision)
             camera_out_enabled=False,  # Set to True if bot outputs video
-            vad_analyzer=SileroVADAnalyzer(params=VADParams(stop_secs=0.2)),
-            turn_analyzer=LocalSmartTurnAnalyzerV3(),
+            vad_analyzer=_vad_analyzer(),
+            turn_analyzer=_turn_analyzer(),
         ),
         # ALTERNATIVE: Daily.co transport
         "daily": lambda: DailyParams(
             audio_in_enabled=True,
             audio_out_enabled=True,
-            vad_analyzer=SileroVADAnalyzer(params=VADParams(stop_secs=0.2)),
-            turn_analyzer=LocalSmartTurnAnalyzerV3(),
+            vad_analyzer=_vad_analyzer(),
+            turn_analyzer=_turn_analyzer(),
         ),
         # ALTERNATIVE: Generic WebRTC transport
         "webrtc": lambda: TransportParams(
             audio_in_enabled=True,
             audio_out_enabled=True,
-            vad_analyzer=SileroVADAnalyzer(params=VADParams(stop_secs=0.2)),
-            turn_analyzer=LocalSmartTurnAnalyzerV3(),
+            vad_analyzer=_vad_analyzer(),
+            turn_analyzer=_turn_analyzer(),
         ),
     }
 
     transport = await create_transport(runner_args, transport_params)
 
-    await run_bot(transport, runner_args)
+    # Pooled TTS connections are shared across sessions and released when the
+    # last one ends
+    async with shared_http_client():
+        await run_bot(transport, runner_args)
 
 
 if __name__ == "__main__":
@@ -191,4 +235,13 @@ if __name__ == "__main__":
     # Add required attributes for PipelineRunner
     setattr(args, "handle_sigint", True)
     
-    asyncio.run(bot(args))
+    try:
+        # libuv-based event loop: lower per-callback overhead for the many small
+        # awaits in the pipeline (not available on Windows)
+        import uvloop
+
+        run = uvloop.run
+    except ImportError:
+        run = asyncio.run
+    
+    run(bot(args))
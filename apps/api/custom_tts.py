@@ -1,5 +1,7 @@
 """Custom TTS Service for OpenAI-compatible endpoints with custom voices."""
 
+import os
+
 from pipecat.services.openai.tts import OpenAITTSService, VALID_VOICES
 
 
@@ -15,12 +17,22 @@ def add_custom_voice(voice_id: str):
         VALID_VOICES[voice_id] = voice_id
 
 
+# Register the configured voices (TTS_VOICE plus comma-separated TTS_VOICES)
+# once at import, so any OpenAITTSService in the process accepts them
+_env_voices = [os.getenv("TTS_VOICE", ""), *os.getenv("TTS_VOICES", "").split(",")]
+VALID_VOICES.update(
+    {voice: voice for voice in map(str.strip, _env_voices) if voice and voice not in VALID_VOICES}
+)
+
+
 class CustomOpenAITTSService(OpenAITTSService):
     """
     Custom OpenAI TTS Service that supports custom voices.
     
-    This extends the standard OpenAITTSService to automatically register
-    custom voices not in OpenAI's standard list (like kokoro voices: af_heart, etc.).
+    This extends the standard OpenAITTSService to accept custom voices not in
+    OpenAI's standard list (like kokoro voices: af_heart, etc.). Voices from
+    TTS_VOICE / TTS_VOICES are registered at import, and the voice passed to
+    the constructor is registered too if it is not already known.
     """
     
     def __init__(
@@ -1,10 +1,12 @@
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.responses import ORJSONResponse
 
 app = FastAPI(
     title="PipeChat Voice Agent API",
     description="Backend API for PipeChat Voice Agent",
     version="0.1.0",
+    default_response_class=ORJSONResponse,
 )
 
 # Configure CORS
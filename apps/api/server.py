@@ -1,7 +1,8 @@
 import os
 import uvicorn
-from fastapi import FastAPI, HTTPException
+from fastapi import FastAPI, HTTPException, Request
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.responses import ORJSONResponse
 from pydantic import BaseModel
 from livekit import api
 from dotenv import load_dotenv
@@ -25,6 +26,17 @@ class TokenRequest(BaseModel):
 async def lifespan(app: FastAPI):
     # Startup
     logger.info("LiveKit Token Server starting...")
+
+    # Read LiveKit configuration once; every /token request reuses it
+    app.state.lk_key = os.getenv("LIVEKIT_API_KEY")
+    app.state.lk_secret = os.getenv("LIVEKIT_API_SECRET")
+    app.state.lk_url = os.getenv("LIVEKIT_URL")
+
+    if not all([app.state.lk_key, app.state.lk_secret, app.state.lk_url]):
+        raise RuntimeError(
+            "LiveKit configuration missing. Please set LIVEKIT_API_KEY, LIVEKIT_API_SECRET, and LIVEKIT_URL in .env"
+        )
+
     yield
     # Shutdown
     logger.info("LiveKit Token Server shutting down...")
@@ -33,7 +45,8 @@ async def lifespan(app: FastAPI):
 app = FastAPI(
     title="PipeChat LiveKit Token Server",
     description="Token generation server for LiveKit client authentication",
-   lifespan=lifespan
+    default_response_class=ORJSONResponse,
+    lifespan=lifespan
 )
 
 # CORS configuration
@@ -47,32 +60,27 @@ app.add_middleware(
 
 
 @app.post("/token")
-async def get_token(req: TokenRequest):
+async def get_token(req: TokenRequest, request: Request):
     """
     Generate a LiveKit access token for the frontend client.
     
+    LiveKit configuration is validated at startup (see lifespan), so it is
+    not re-checked here.
+    
     Args:
         req: TokenRequest with room, identity, and name
+        request: Incoming request, used to reach the app state
         
     Returns:
         dict with 'token' (JWT) and 'url' (LiveKit server URL)
         
     Raises:
-        HTTPException: If LiveKit configuration is missing or token generation fails
+        HTTPException: If token generation fails
     """
+    state = request.app.state
     try:
-        api_key = os.getenv("LIVEKIT_API_KEY")
-        api_secret = os.getenv("LIVEKIT_API_SECRET")
-        livekit_url = os.getenv("LIVEKIT_URL")
-
-        if not all([api_key, api_secret, livekit_url]):
-            raise HTTPException(
-                status_code=500,
-                detail="LiveKit configuration missing. Please set LIVEKIT_API_KEY, LIVEKIT_API_SECRET, and LIVEKIT_URL in .env"
-            )
-
         # Create access token with room join permissions
-        token = api.AccessToken(api_key, api_secret) \
+        token = api.AccessToken(state.lk_key, state.lk_secret) \
             .with_identity(req.identity) \
             .with_name(req.name) \
             .with_grants(api.VideoGrants(
@@ -84,10 +92,8 @@ async def get_token(req: TokenRequest):
 
         return {
             "token": token.to_jwt(),
-            "url": livekit_url
+            "url": state.lk_url
         }
-    except HTTPException:
-        raise
     except Exception as e:
         logger.error(f"Error generating token: {e}", exc_info=True)
         raise HTTPException(status_code=500, detail=f"Token generation failed: {str(e)}")
@@ -133,5 +139,6 @@ if __name__ == "__main__":
         app,
         host="0.0.0.0",
         port=int(os.getenv("TOKEN_SERVER_PORT", "7860")),
+        loop="auto",  # uvloop when installed, asyncio otherwise
         log_level="info"
     )
@@ -0,0 +1,86 @@
+"""VAD and turn analyzers that share their ONNX models across sessions."""
+
+import functools
+from importlib import resources
+from typing import Optional
+
+import onnxruntime as ort
+from loguru import logger
+from pipecat.audio.turn.smart_turn.base_smart_turn import BaseSmartTurn
+from pipecat.audio.turn.smart_turn.local_smart_turn_v3 import LocalSmartTurnAnalyzerV3
+from pipecat.audio.vad.silero import SileroOnnxModel, SileroVADAnalyzer
+from pipecat.audio.vad.vad_analyzer import VADAnalyzer
+from transformers import WhisperFeatureExtractor
+
+
+@functools.lru_cache(maxsize=1)
+def _silero_session():
+    """Load the Silero ONNX session once per process."""
+    logger.info("Loading shared Silero VAD model...")
+    # Build the model directly: a throwaway SileroVADAnalyzer would also
+    # leave its inference executor behind
+    model_path = resources.files("pipecat.audio.vad.data").joinpath("silero_vad.onnx")
+    return SileroOnnxModel(str(model_path), force_onnx_cpu=True).session
+
+
+@functools.lru_cache(maxsize=None)
+def _smart_turn_model(smart_turn_model_path: Optional[str], cpu_count: int):
+    """Load a smart-turn-v3 ONNX session and feature extractor once per process."""
+    logger.info("Loading shared Local Smart Turn v3 model...")
+    if not smart_turn_model_path:
+        smart_turn_model_path = str(
+            resources.files("pipecat.audio.turn.smart_turn.data").joinpath("smart-turn-v3.0.onnx")
+        )
+
+    # Same session options as LocalSmartTurnAnalyzerV3
+    so = ort.SessionOptions()
+    so.execution_mode = ort.ExecutionMode.ORT_SEQUENTIAL
+    so.inter_op_num_threads = 1
+    so.intra_op_num_threads = cpu_count
+    so.graph_optimization_level = ort.GraphOptimizationLevel.ORT_ENABLE_ALL
+
+    session = ort.InferenceSession(smart_turn_model_path, sess_options=so)
+    return session, WhisperFeatureExtractor(chunk_length=8)
+
+
+class SharedSileroVADAnalyzer(SileroVADAnalyzer):
+    """
+    Silero VAD analyzer that reuses a process-wide ONNX session.
+
+    Only the model weights are shared. The recurrent model state, audio
+    buffers and inference executor stay per instance, so every transport
+    still gets its own analyzer.
+    """
+
+    def __init__(self, **kwargs):
+        """Initialize without loading a new copy of the model."""
+        # Skip SileroVADAnalyzer.__init__, which creates a fresh ONNX session
+        VADAnalyzer.__init__(self, **kwargs)
+
+        self._model = SileroOnnxModel.__new__(SileroOnnxModel)
+        self._model.session = _silero_session()
+        self._model.sample_rates = [8000, 16000]
+        self._model.reset_states()
+
+        self._last_reset_time = 0
+
+
+class SharedLocalSmartTurnAnalyzerV3(LocalSmartTurnAnalyzerV3):
+    """
+    Smart turn v3 analyzer that reuses a process-wide ONNX session.
+
+    The session and feature extractor are stateless between calls; the
+    speech buffer and inference executor stay per instance. One session is
+    kept per model path and CPU count.
+    """
+
+    def __init__(
+        self, *, smart_turn_model_path: Optional[str] = None, cpu_count: int = 1, **kwargs
+    ):
+        """Initialize without loading a new copy of the model."""
+        # Skip LocalSmartTurnAnalyzerV3.__init__, which creates a fresh ONNX session
+        BaseSmartTurn.__init__(self, **kwargs)
+
+        self._session, self._feature_extractor = _smart_turn_model(
+            smart_turn_model_path, cpu_count
+        )
@@ -1,13 +1,149 @@
-from pipecat.frames.frames import Frame, TTSStartedFrame, TTSStoppedFrame, TextFrame, OutputTransportMessageFrame
+from pipecat.frames.frames import (
+    CancelFrame,
+    EndFrame,
+    Frame,
+    InterimTranscriptionFrame,
+    InterruptionFrame,
+    LLMFullResponseEndFrame,
+    OutputTransportMessageFrame,
+    SystemFrame,
+    TextFrame,
+    TranscriptionFrame,
+    TTSAudioRawFrame,
+    TTSStartedFrame,
+    TTSStoppedFrame,
+)
 from pipecat.processors.frame_processor import FrameProcessor, FrameDirection
 from pipecat.services.openai.tts import OpenAITTSService
-from typing import AsyncGenerator, List, Dict, Any
+from pipecat.utils.text.simple_text_aggregator import SimpleTextAggregator
+from typing import AsyncGenerator, AsyncIterator, List, Dict, Any, Optional, Union
+import asyncio
+import contextlib
+import itertools
 import os
+import re
 import time
-import base64
-import json
 from loguru import logger
 import httpx
+import numpy as np
+import orjson
+import pybase64
+
+
+# Shared client so consecutive utterances reuse pooled connections instead of
+# paying a new TCP/TLS handshake per sentence, and concurrent sentence
+# requests are multiplexed over one HTTP/2 connection. Created on first use
+# and closed when the last bot session holding it ends.
+_HTTP: Optional[httpx.AsyncClient] = None
+_HTTP_SESSIONS = 0
+
+
+# Strictly increasing sequence IDs for timing messages (one per sentence)
+_SEQ = itertools.count(1)
+
+# Word timing as parallel columns: (words, start_times, end_times), in seconds
+WordTimings = tuple[List[str], np.ndarray, np.ndarray]
+
+# Sentences synthesized ahead of playback at once
+_MAX_CONCURRENT_SYNTHESES = 3
+
+# Tokenizer and extra hold time (seconds) after trailing punctuation for
+# estimated word timing
+_WORD_RE = re.compile(r"\S+")
+_PUNCTUATION_PAUSES = {
+    ".": 0.25, "!": 0.25, "?": 0.25,
+    ",": 0.12, ";": 0.12, ":": 0.12,
+}
+
+# Consecutive Kokoro failures before it is skipped, and the cap on the
+# exponential cooldown (2**failures seconds)
+_KOKORO_FAILURE_THRESHOLD = 3
+_KOKORO_MAX_COOLDOWN_SECS = 60
+
+# Raw PCM frame size for TTS_BINARY_FRAMES: 4800 samples (200ms at 24kHz), 16-bit
+_PCM_FRAME_BYTES = 4800 * 2
+
+
+# How often PROFILE=1 summaries are emitted
+_PROFILE_REPORT_INTERVAL_SECS = 5.0
+
+
+class _StageProfiler:
+    """
+    Accumulates wall time per pipeline stage for PROFILE=1 runs.
+    
+    Stages are timed with perf_counter_ns around the awaits they cover, so
+    time spent waiting on the network or on downstream processors is
+    attributed to the stage doing the waiting.
+    """
+    
+    def __init__(self):
+        self._total_ns: Dict[str, int] = {}
+        self._calls: Dict[str, int] = {}
+        self._last_report = time.monotonic()
+    
+    def add(self, stage: str, start_ns: int):
+        """Record time elapsed since `start_ns` (from perf_counter_ns) for `stage`."""
+        elapsed = time.perf_counter_ns() - start_ns
+        self._total_ns[stage] = self._total_ns.get(stage, 0) + elapsed
+        self._calls[stage] = self._calls.get(stage, 0) + 1
+    
+    def report_due(self) -> bool:
+        """Whether a summary is due."""
+        return time.monotonic() - self._last_report >= _PROFILE_REPORT_INTERVAL_SECS
+    
+    def summary(self) -> Dict[str, Any]:
+        """Return the per-stage summary since the last report and reset the counters."""
+        now = time.monotonic()
+        stages = {
+            stage: {
+                "calls": calls,
+                "total_ms": round(self._total_ns[stage] / 1e6, 3),
+                "avg_ms": round(self._total_ns[stage] / calls / 1e6, 3),
+            }
+            for stage, calls in self._calls.items()
+        }
+        summary = {
+            "type": "perf",
+            "interval_secs": round(now - self._last_report, 3),
+            "stages": stages,
+        }
+        self._total_ns.clear()
+        self._calls.clear()
+        self._last_report = now
+        return summary
+
+
+def _http_client() -> httpx.AsyncClient:
+    """Return the shared TTS HTTP client, creating it if needed."""
+    global _HTTP
+    if _HTTP is None:
+        _HTTP = httpx.AsyncClient(
+            http2=True,
+            timeout=httpx.Timeout(30.0, connect=2.0),
+            limits=httpx.Limits(max_keepalive_connections=16, max_connections=32),
+        )
+    return _HTTP
+
+
+@contextlib.asynccontextmanager
+async def shared_http_client() -> AsyncIterator[None]:
+    """
+    Keep the shared TTS HTTP client open for the duration of a bot session.
+    
+    Sessions overlap when the runner serves several rooms, so the client is
+    only closed when the last session holding it ends.
+    """
+    global _HTTP, _HTTP_SESSIONS
+    _HTTP_SESSIONS += 1
+    try:
+        yield
+    finally:
+        _HTTP_SESSIONS -= 1
+        if _HTTP_SESSIONS == 0 and _HTTP is not None:
+            # A session starting while this closes gets a fresh client
+            client, _HTTP = _HTTP, None
+            await client.aclose()
 
 
 class TTSWithTimingProcessor(FrameProcessor):
@@ -19,7 +155,9 @@ class TTSWithTimingProcessor(FrameProcessor):
     
     Features:
     - Extracts native timing from Kokoro TTS /captioned_speech endpoint
-    - Emits custom RTVI events: 'bot-tts-timing' with word timestamps
+    - Emits custom RTVI events: 'bot-tts-timing' with word timestamps, sent
+      in 'bot-tts-timing-batch' messages that also carry the timing of later
+      sentences already synthesized, to limit data channel traffic
     - Falls back to estimation for non-Kokoro TTS services
     - Maintains audio streaming without breaking Pipecat pipeline
     - Adds sequence IDs for robust audio/timing synchronization
@@ -40,55 +178,276 @@ class TTSWithTimingProcessor(FrameProcessor):
         self.tts_service = tts_service
         self._processing_text = False
         
+        # Snapshot TTS configuration once rather than on every utterance
+        self._tts_base_url = os.getenv("TTS_BASE_URL")
+        self._tts_api_key = os.getenv("TTS_API_KEY")
+        self._tts_model = os.getenv("TTS_MODEL", "kokoro")
+        self._tts_voice = os.getenv("TTS_VOICE", "af_heart")
+        self._tts_binary_frames = os.getenv("TTS_BINARY_FRAMES", "0") == "1"
+        self._use_kokoro = (
+            os.getenv("TTS_BACKEND", "kokoro").lower() == "kokoro"
+            and bool(self._tts_base_url)
+        )
+        self._auth_headers = {
+            "Authorization": f"Bearer {self._tts_api_key}",
+            "Content-Type": "application/json"
+        }
+        
+        # Opt-in per-stage latency counters (PROFILE=1)
+        self._profiler: Optional[_StageProfiler] = (
+            _StageProfiler() if os.getenv("PROFILE", "0") == "1" else None
+        )
+        
+        # Circuit breaker: stop trying Kokoro for a while after repeated failures
+        self._kokoro_fail_count = 0
+        self._kokoro_disabled_until = 0.0
+        
+        # LLM text arrives one token delta per frame; synthesize whole sentences
+        self._text_aggregator = SimpleTextAggregator()
+        self._synthesis_slots = asyncio.Semaphore(_MAX_CONCURRENT_SYNTHESES)
+        
+        # In-flight work in arrival order. Text entries carry the synthesis task
+        # and the queue it streams frames into (ending with None, preceded by
+        # the exception if synthesis failed); other entries are pass-through.
+        self._inflight: asyncio.Queue[
+            tuple[Frame, FrameDirection, Optional[asyncio.Task], Optional[asyncio.Queue]]
+        ] = asyncio.Queue()
+        self._consumer_task: Optional[asyncio.Task] = None
+        
+        # Timing messages not yet sent, per sentence (sequence_id) in queue order
+        self._timing_buf: Dict[int, List[Dict[str, Any]]] = {}
+        
     async def process_frame(self, frame: Frame, direction: FrameDirection):
         """
         Process incoming frames and add timing extraction.
         
+        Text is aggregated into sentences. Synthesis for each sentence starts
+        in its own task (at most _MAX_CONCURRENT_SYNTHESES at a time), so the
+        next sentence is synthesized while the previous one is still being
+        pushed downstream. A single consumer pushes results in arrival order.
+        
         Args:
             frame: The frame to process
             direction: The direction of frame flow
         """
         await super().process_frame(frame, direction)
         
-        # Handle text frames that need TTS synthesis
-        if isinstance(frame, TextFrame):
-            logger.debug(f"TTS Timing: Processing text: {frame.text}")
+        if self._profiler:
+            t0 = time.perf_counter_ns()
+            await self._dispatch_frame(frame, direction)
+            self._profiler.add("process_frame", t0)
+        else:
+            await self._dispatch_frame(frame, direction)
+    
+    async def _dispatch_frame(self, frame: Frame, direction: FrameDirection):
+        """Route a frame to synthesis, the ordered queue, or straight through."""
+        if isinstance(frame, InterruptionFrame):
+            # Drop any synthesis the user has talked over
+            await self._cancel_inflight()
+            await self.push_frame(frame, direction)
+        elif isinstance(frame, CancelFrame):
+            await self._cancel_inflight()
+            await self.push_frame(frame, direction)
+        elif isinstance(frame, SystemFrame) or direction == FrameDirection.UPSTREAM:
+            # System and upstream frames are never queued behind audio
+            await self.push_frame(frame, direction)
+        elif (
+            isinstance(frame, TextFrame)
+            and not frame.skip_tts
+            and not isinstance(frame, (TranscriptionFrame, InterimTranscriptionFrame))
+        ):
+            sentence = await self._text_aggregator.aggregate(frame.text)
+            if sentence:
+                await self._synthesize_sentence(sentence, direction)
+        else:
+            if isinstance(frame, (LLMFullResponseEndFrame, EndFrame)):
+                # Speak whatever is left of the response
+                sentence = self._text_aggregator.text
+                await self._text_aggregator.reset()
+                await self._synthesize_sentence(sentence, direction)
+            
+            # Pass through other frames unchanged, after any pending audio
+            await self._enqueue(frame, direction, None, None)
+    
+    async def _synthesize_sentence(self, text: str, direction: FrameDirection):
+        """Start synthesis for one sentence and queue it behind earlier work."""
+        if not text.strip():
+            return
+        
+        logger.debug(f"TTS Timing: Processing text: {text}")
+        
+        # Add sequence ID for robust audio/timing synchronization
+        sequence_id = next(_SEQ)
+        
+        frames: asyncio.Queue[Union[Frame, Exception, None]] = asyncio.Queue()
+        self._timing_buf[sequence_id] = []
+        task = self.create_task(self._produce(text, sequence_id, frames))
+        await self._enqueue(TextFrame(text=text), direction, task, frames)
+    
+    async def cleanup(self):
+        """Cancel pending synthesis when the processor is torn down."""
+        await super().cleanup()
+        await self._cancel_inflight()
+    
+    async def _enqueue(
+        self,
+        frame: Frame,
+        direction: FrameDirection,
+        task: Optional[asyncio.Task],
+        frames: Optional[asyncio.Queue],
+    ):
+        """Queue a frame (and its synthesis, if any) behind earlier work."""
+        if not self._consumer_task:
+            self._consumer_task = self.create_task(self._consume_inflight())
+        await self._inflight.put((frame, direction, task, frames))
+    
+    async def _produce(self, text: str, sequence_id: int, frames: asyncio.Queue):
+        """Run synthesis for one sentence, streaming its output into `frames`."""
+        try:
+            # Waiters acquire in creation order, so earlier sentences go first
+            async with self._synthesis_slots:
+                t0 = time.perf_counter_ns()
+                first_frame = True
+                try:
+                    async for out_frame in self._synthesize_with_timing(text, sequence_id):
+                        if first_frame and self._profiler:
+                            self._profiler.add("tts_first_frame", t0)
+                        first_frame = False
+                        if isinstance(out_frame, OutputTransportMessageFrame):
+                            # Sent by the consumer, ahead of the audio it describes
+                            self._timing_buf[sequence_id].append(out_frame.message)
+                        else:
+                            await frames.put(out_frame)
+                finally:
+                    if self._profiler:
+                        self._profiler.add("tts_synthesis", t0)
+        except Exception as e:
+            # Tasks from create_task swallow exceptions, so hand it to the consumer
+            await frames.put(e)
+        finally:
+            # End-of-utterance marker
+            await frames.put(None)
+    
+    async def _consume_inflight(self):
+        """Push queued frames downstream, preserving arrival order."""
+        while True:
+            frame, direction, task, frames = await self._get_next_item(self._inflight)
+            
+            if task is None:
+                await self._push_output(frame, direction)
+                continue
             
-            # Get timing and audio from TTS backend
             try:
-                audio_frames, timings = await self._synthesize_with_timing(frame.text)
-                
-                # Emit timing as RTVI data message (LiveKit will send via data channel)
-                # Add sequence ID for robust audio/timing synchronization
-                sequence_id = int(time.time() * 1000)  # Millisecond timestamp as sequence
-                
-                timing_data = {
-                    "type": "bot-tts-timing",
-                    "sequence_id": sequence_id,
-                    "words": [t["word"] for t in timings],
-                    "word_times": [t["start_time"] for t in timings],
-                    "word_durations": [t["end_time"] - t["start_time"] for t in timings],
-                    "text": frame.text
-                }
-                
-                logger.info(f"Emitting timing event: {len(timings)} words for text: '{frame.text[:50]}...'")
-                
-                # Send timing via LiveKit data channel
-                await self.push_frame(OutputTransportMessageFrame(message=timing_data))
-                
-                # Push audio frames
-                for audio_frame in audio_frames:
-                    await self.push_frame(audio_frame)
-                    
-            except Exception as e:
-                logger.error(f"Error in TTS timing processor: {e}", exc_info=True)
-                # Fallback: let the original TTS service handle it
-                await self.push_frame(frame, direction)
+                # Stream this utterance as it is produced; later utterances keep
+                # synthesizing in the background meanwhile
+                while (out_frame := await self._get_next_item(frames)) is not None:
+                    if isinstance(out_frame, Exception):
+                        logger.opt(exception=out_frame).error(
+                            f"Error in TTS timing processor: {out_frame}"
+                        )
+                        # Fallback: let the original TTS service handle it
+                        await self._push_output(frame, direction)
+                    else:
+                        await self._push_output(out_frame)
+            except asyncio.CancelledError:
+                task.cancel()
+                raise
+            
+            # The sentence just pushed is always the oldest one buffered
+            del self._timing_buf[next(iter(self._timing_buf))]
+    
+    async def _get_next_item(self, queue: asyncio.Queue):
+        """Get the next queue item."""
+        if self._profiler:
+            t0 = time.perf_counter_ns()
+            item = await queue.get()
+            self._profiler.add("consumer_wait", t0)
+            return item
+        return await queue.get()
+    
+    async def _push_output(self, frame: Frame, direction: FrameDirection = FrameDirection.DOWNSTREAM):
+        """
+        Push a frame downstream, sending buffered timing ahead of audio.
+        
+        The output transport sends messages and audio in queue order, so any
+        buffered timing is flushed before each audio frame.
+        """
+        if isinstance(frame, TTSAudioRawFrame):
+            await self._flush_timing()
+        
+        if self._profiler:
+            t0 = time.perf_counter_ns()
+            await self.push_frame(frame, direction)
+            self._profiler.add("push_frame", t0)
         else:
-            # Pass through other frames unchanged
             await self.push_frame(frame, direction)
+        
+        if self._profiler and self._profiler.report_due():
+            summary = self._profiler.summary()
+            logger.info(f"TTS timing processor perf: {summary}")
+            await self.push_frame(OutputTransportMessageFrame(message=summary))
     
-    async def _synthesize_with_timing(self, text: str) -> tuple[List[Frame], List[Dict[str, Any]]]:
+    async def _flush_timing(self):
+        """
+        Send buffered timing messages as a single batch message.
+        
+        Besides the sentence being pushed, the batch carries timing already
+        buffered for the sentences queued after it, stopping at the first one
+        with nothing buffered so the client still receives utterances in order.
+        """
+        items: List[Dict[str, Any]] = []
+        for messages in self._timing_buf.values():
+            if not messages:
+                break
+            items.extend(messages)
+            messages.clear()
+        
+        if not items:
+            return
+        
+        await self.push_frame(
+            OutputTransportMessageFrame(message={"type": "bot-tts-timing-batch", "items": items})
+        )
+    
+    async def _cancel_inflight(self):
+        """Cancel the consumer and every pending synthesis task."""
+        if self._consumer_task:
+            await self.cancel_task(self._consumer_task)
+            self._consumer_task = None
+        
+        while not self._inflight.empty():
+            _, _, task, _ = self._inflight.get_nowait()
+            if task:
+                await self.cancel_task(task)
+        
+        # Timing for audio that will never play, and text that won't be spoken
+        self._timing_buf.clear()
+        await self._text_aggregator.handle_interruption()
+    
+    def _timing_frame(
+        self,
+        sequence_id: int,
+        text: str,
+        timings: WordTimings,
+    ) -> OutputTransportMessageFrame:
+        """
+        Build an RTVI timing message (LiveKit will send via data channel).
+        
+        Several messages may share a sequence_id; the frontend appends their
+        words to the same utterance.
+        """
+        words, start_times, end_times = timings
+        timing_data = {
+            "type": "bot-tts-timing",
+            "sequence_id": sequence_id,
+            "words": words,
+            "word_times": start_times.tolist(),
+            "word_durations": (end_times - start_times).tolist(),
+            "text": text
+        }
+        return OutputTransportMessageFrame(message=timing_data)
+    
+    async def _synthesize_with_timing(self, text: str, sequence_id: int) -> AsyncGenerator[Frame, None]:
         """
         Call TTS endpoint with timing support.
         
@@ -96,112 +455,201 @@ class TTSWithTimingProcessor(FrameProcessor):
         for precise word-level timing. If that fails, it falls back to standard
         TTS with estimated timing.
         
+        Frames are yielded as soon as they are available so audio playback can
+        start while the rest of the utterance is still being received.
+        
         Args:
             text: The text to synthesize
+            sequence_id: Sequence ID attached to the emitted timing messages
             
-        Returns:
-            tuple: (audio_frames, timing_data)
-                - audio_frames: List of audio frames from TTS
-                - timing_data: List of dict with 'word', 'start_time', 'end_time'
-        """
-        # Get TTS configuration from environment
-        tts_base_url = os.getenv("TTS_BASE_URL")
-        tts_api_key = os.getenv("TTS_API_KEY")
-        tts_model = os.getenv("TTS_MODEL", "kokoro")
-        tts_voice = os.getenv("TTS_VOICE", "af_heart")
-        tts_backend = os.getenv("TTS_BACKEND", "kokoro")
-        
-        # Try native timing endpoint first (Kokoro TTS)
-        if tts_backend.lower() == "kokoro" and tts_base_url:
+        Yields:
+            Timing message frames and audio frames, in playback order
+        """
+        timing_sent = False
+        
+        # Try native timing endpoint first (Kokoro TTS), unless it is cooling down
+        if self._use_kokoro and time.monotonic() >= self._kokoro_disabled_until:
+            payload = {
+                "model": self._tts_model,
+                "input": text,
+                "voice": self._tts_voice,
+                "speed": 1.0,
+                "response_format": "pcm",
+                "stream": True,
+            }
+            if self._tts_binary_frames:
+                stream = self._stream_kokoro_pcm(payload)
+            else:
+                stream = self._stream_kokoro_captioned(payload, text, sequence_id)
+            
+            audio_emitted = False
+            estimated = False
+            timing_count = 0
             try:
-                logger.debug(f"Attempting Kokoro /captioned_speech endpoint for timing")
-                
-                async with httpx.AsyncClient(timeout=30.0) as client:
-                    response = await client.post(
-                        f"{tts_base_url}/captioned_speech",
-                        headers={
-                            "Authorization": f"Bearer {tts_api_key}",
-                            "Content-Type": "application/json"
-                        },
-                        json={
-                            "model": tts_model,
-                            "input": text,
-                            "voice": tts_voice,
-                            "speed": 1.0,
-                            "response_format": "pcm",
-                            "stream": True,
-                        },
-                    )
-                    
-                    if response.status_code == 200:
-                        logger.debug("Kokoro timing endpoint successful")
-                        
-                        # Parse streaming response for audio and timing
-                        audio_chunks = []
-                        timing_data = []
-                        
-                        # Handle both streaming and non-streaming responses
-                        content = await response.aread()
-                        
-                        # Try to parse as newline-delimited JSON
-                        for line in content.decode('utf-8').split('\n'):
-                            if line.strip():
-                                try:
-                                    data = json.loads(line)
-                                    
-                                    # Extract audio chunks
-                                    if "audio" in data:
-                                        audio_chunks.append(base64.b64decode(data["audio"]))
-                                    
-                                    # Extract timing data
-                                    if "word_timings" in data:
-                                        for timing in data["word_timings"]:
-                                            timing_data.append({
-                                                "word": timing["word"],
-                                                "start_time": timing["start"],
-                                                "end_time": timing["end"],
-                                            })
-                                except json.JSONDecodeError:
-                                    # Might be raw audio data
-                                    logger.debug("Non-JSON line in response, skipping")
-                                    continue
-                        
-                        if audio_chunks and timing_data:
-                            # Convert audio to frames using the wrapped TTS service
-                            audio_bytes = b"".join(audio_chunks)
-                            
-                            # Use the TTS service to create proper audio frames
-                            # We'll push the raw audio through the service's processing
-                            from pipecat.frames.frames import TTSAudioRawFrame
-                            audio_frames = [TTSAudioRawFrame(
-                                audio=audio_bytes,
-                                sample_rate=24000,
-                                num_channels=1
-                            )]
-                            
-                            logger.info(f"Successfully extracted {len(timing_data)} word timings from Kokoro")
-                            return audio_frames, timing_data
-                    else:
-                        logger.warning(f"Kokoro /captioned_speech returned {response.status_code}")
+                async for out_frame in stream:
+                    if isinstance(out_frame, TTSAudioRawFrame):
+                        if not timing_sent:
+                            # No timing ahead of the first audio (always the case
+                            # in binary mode): estimate it so the client has the
+                            # words before playback starts
+                            if not self._tts_binary_frames:
+                                logger.warning("Kokoro returned no word timings, using estimated timing")
+                            yield self._estimated_timing_frame(text, sequence_id)
+                            timing_sent = estimated = True
+                        audio_emitted = True
+                    elif estimated:
+                        # Late native timing would duplicate the estimated words
+                        continue
+                    elif isinstance(out_frame, OutputTransportMessageFrame):
+                        timing_sent = True
+                        timing_count += len(out_frame.message["words"])
+                    yield out_frame
             
             except (httpx.HTTPError, Exception) as e:
+                if audio_emitted:
+                    # Audio is already on its way to the client, so falling back
+                    # now would repeat the start of the utterance.
+                    logger.error(f"Kokoro stream interrupted: {e}")
+                    self._record_kokoro_failure()
+                    return
                 logger.warning(f"Native timing endpoint failed: {e}, falling back to estimation")
+            
+            if audio_emitted:
+                self._kokoro_fail_count = 0
+                if timing_count:
+                    logger.info(f"Successfully extracted {timing_count} word timings from Kokoro")
+                return
+            
+            self._record_kokoro_failure()
         
         # Fallback: Use standard TTS service and estimate timing
         logger.debug("Using standard TTS with estimated timing")
         
-        # Generate audio using the wrapped TTS service
-        audio_frames = []
+        # Generate audio using the wrapped TTS service. The estimated timing is
+        # held back until the first audio frame, so a sentence that fails here
+        # sends no timing. Skip it if Kokoro already sent timing for this
+        # sequence_id, which the frontend would merge and show twice.
         async for frame in self.tts_service.run_tts(text):
-            audio_frames.append(frame)
+            if not timing_sent and isinstance(frame, TTSAudioRawFrame):
+                yield self._estimated_timing_frame(text, sequence_id)
+                timing_sent = True
+            yield frame
+    
+    def _record_kokoro_failure(self):
+        """Count a failed Kokoro attempt and open the circuit breaker if needed."""
+        self._kokoro_fail_count += 1
+        if self._kokoro_fail_count >= _KOKORO_FAILURE_THRESHOLD:
+            cooldown = min(_KOKORO_MAX_COOLDOWN_SECS, 2 ** self._kokoro_fail_count)
+            self._kokoro_disabled_until = time.monotonic() + cooldown
+            logger.warning(
+                f"Kokoro failed {self._kokoro_fail_count} times in a row, "
+                f"using standard TTS for the next {cooldown}s"
+            )
+    
+    async def _stream_kokoro_captioned(
+        self,
+        payload: Dict[str, Any],
+        text: str,
+        sequence_id: int,
+    ) -> AsyncGenerator[Frame, None]:
+        """
+        Stream audio and native word timing from Kokoro's /captioned_speech.
         
-        # Estimate timing based on text
-        estimated_timing = self._estimate_word_timing(text)
+        The response is newline-delimited JSON with base64 "audio" and
+        "word_timings" fields; each row is emitted as soon as it arrives.
+        """
+        logger.debug("Attempting Kokoro /captioned_speech endpoint for timing")
         
-        logger.info(f"Using estimated timing for {len(estimated_timing)} words")
-        return audio_frames, estimated_timing
+        async with _http_client().stream(
+            "POST",
+            f"{self._tts_base_url}/captioned_speech",
+            headers=self._auth_headers,
+            json=payload,
+        ) as response:
+            if response.status_code != 200:
+                logger.warning(f"Kokoro /captioned_speech returned {response.status_code}")
+                return
+            
+            logger.debug("Kokoro timing endpoint successful")
+            
+            # Parse newline-delimited JSON rows as they arrive
+            async for line in response.aiter_lines():
+                if not line.strip():
+                    continue
+                try:
+                    data = orjson.loads(line)
+                except orjson.JSONDecodeError:
+                    # Might be raw audio data
+                    logger.debug("Non-JSON line in response, skipping")
+                    continue
+                
+                # Emit timing ahead of the audio it describes
+                word_timings = data.get("word_timings")
+                if word_timings:
+                    count = len(word_timings)
+                    yield self._timing_frame(
+                        sequence_id,
+                        text,
+                        (
+                            [t["word"] for t in word_timings],
+                            np.fromiter((t["start"] for t in word_timings), np.float64, count),
+                            np.fromiter((t["end"] for t in word_timings), np.float64, count),
+                        ),
+                    )
+                
+                if "audio" in data:
+                    yield TTSAudioRawFrame(
+                        audio=pybase64.b64decode(data["audio"]),
+                        sample_rate=24000,
+                        num_channels=1
+                    )
     
-    def _estimate_word_timing(self, text: str) -> List[Dict[str, Any]]:
+    async def _stream_kokoro_pcm(self, payload: Dict[str, Any]) -> AsyncGenerator[Frame, None]:
+        """
+        Stream raw PCM from Kokoro's OpenAI-compatible /audio/speech endpoint.
+        
+        Enabled with TTS_BINARY_FRAMES=1. This avoids the base64 overhead of
+        /captioned_speech, but Kokoro only reports word timing on that endpoint,
+        so only audio frames are yielded and the caller estimates the timing.
+        """
+        logger.debug("Attempting Kokoro /audio/speech endpoint for raw PCM")
+        
+        async with _http_client().stream(
+            "POST",
+            f"{self._tts_base_url}/audio/speech",
+            headers={**self._auth_headers, "Accept": "application/octet-stream"},
+            json=payload,
+        ) as response:
+            if response.status_code != 200:
+                logger.warning(f"Kokoro /audio/speech returned {response.status_code}")
+                return
+            
+            # Re-slice the byte stream into fixed frames (200ms of 16-bit mono).
+            # Chunks are appended in place and consumed from the front, and each
+            # frame is sliced through a memoryview, so each byte is copied once
+            # into the buffer and once into its frame.
+            pending = bytearray()
+            async for chunk in response.aiter_bytes():
+                pending.extend(chunk)
+                while len(pending) >= _PCM_FRAME_BYTES:
+                    # Release the view before resizing the buffer
+                    with memoryview(pending) as view:
+                        audio = bytes(view[:_PCM_FRAME_BYTES])
+                    del pending[:_PCM_FRAME_BYTES]
+                    yield TTSAudioRawFrame(audio=audio, sample_rate=24000, num_channels=1)
+            
+            # Flush the tail, dropping any odd byte that would split a sample
+            del pending[len(pending) - len(pending) % 2:]
+            if pending:
+                yield TTSAudioRawFrame(audio=bytes(pending), sample_rate=24000, num_channels=1)
+    
+    def _estimated_timing_frame(self, text: str, sequence_id: int) -> OutputTransportMessageFrame:
+        """Build a timing message from estimated word timing."""
+        timings = self._estimate_word_timing(text)
+        logger.info(f"Using estimated timing for {len(timings[0])} words")
+        return self._timing_frame(sequence_id, text, timings)
+    
+    def _estimate_word_timing(self, text: str) -> WordTimings:
         """
         Estimate word timing when native timing is unavailable.
         
@@ -213,29 +661,29 @@ class TTSWithTimingProcessor(FrameProcessor):
             text: The text to estimate timing for
             
         Returns:
-            List of timing dictionaries with 'word', 'start_time', 'end_time'
+            tuple: (words, start_times, end_times)
         """
-        words = text.split()
+        words = [match.group() for match in _WORD_RE.finditer(text)]
+        count = len(words)
         
         # Estimate based on average speaking rate
         # Typical rate: ~150 words per minute = 2.5 words/second = 0.4 seconds/word
         # We'll use a slightly faster rate for better responsiveness
         avg_duration_per_word = 0.35  # seconds
         
-        timings = []
-        current_time = 0.0
+        # Adjust duration based on word length (longer words take more time)
+        lengths = np.fromiter((len(word) for word in words), dtype=np.float64, count=count)
+        word_length_factor = np.clip(lengths / 5.0, 0.5, 1.5)  # 5 chars = 1.0 factor
         
-        for word in words:
-            # Adjust duration based on word length (longer words take more time)
-            word_length_factor = len(word) / 5.0  # 5 chars = 1.0 factor
-            duration = avg_duration_per_word * max(0.5, min(1.5, word_length_factor))
-            
-            timings.append({
-                "word": word,
-                "start_time": current_time,
-                "end_time": current_time + duration,
-            })
-            
-            current_time += duration
+        # Trailing punctuation holds the word a little longer
+        pauses = np.fromiter(
+            (_PUNCTUATION_PAUSES.get(word[-1], 0.0) for word in words),
+            dtype=np.float64,
+            count=count,
+        )
+        durations = avg_duration_per_word * word_length_factor + pauses
+        
+        end_times = np.cumsum(durations)
+        start_times = end_times - durations
         
-        return timings
+        return words, start_times, end_times
@@ -93,6 +93,23 @@ export default function TalkingHead() {
         };
     }, []);
 
+    // Timing for one utterance may arrive in several messages sharing a sequence_id,
+    // possibly after timing for later utterances has already been queued
+    const enqueueTiming = (timing: TimingData) => {
+        const queue = timingQueueRef.current;
+        const target = [currentTimingRef.current, ...queue].find(
+            (t) => t?.sequence_id === timing.sequence_id
+        );
+
+        if (target) {
+            target.words.push(...timing.words);
+            target.word_times.push(...timing.word_times);
+            target.word_durations.push(...timing.word_durations);
+        } else {
+            queue.push(timing);
+        }
+    };
+
     // Handle incoming timing data via LiveKit data channel
     useEffect(() => {
         if (!room) return;
@@ -103,7 +120,10 @@ export default function TalkingHead() {
 
                 if (msg.type === 'bot-tts-timing') {
                     console.log('Received timing data:', msg);
-                    timingQueueRef.current.push(msg as TimingData);
+                    enqueueTiming(msg as TimingData);
+                } else if (msg.type === 'bot-tts-timing-batch') {
+                    console.log('Received timing batch:', msg);
+                    (msg.items as TimingData[]).forEach(enqueueTiming);
                 } else if (msg.type === 'bot-thinking') {
                     setIsThinking(true);
                 } else if (msg.type === 'bot-response-start') {